@@ -4,36 +4,57 @@ Re-Defined Blog Automation System - Main Application
 import os
 import sys
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 from loguru import logger
+from cachetools import TTLCache
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.database.init_db import init_database
 from src.scheduler.scheduler import BlogScheduler
 from src.content_generator.generator import BlogGenerator
-from src.database.models import BlogPost
-from src.database.init_db import get_session
+from src.publisher.publisher import BlogPublisher
+from src.database.models import BlogPost, ScheduledTask
+from src.database.init_db import get_async_db
 from config.settings import settings
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Re-Defined Blog Automation",
     description="AI-powered blog automation system for Re-Defined",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Compress JSON responses above ~0.5KB (list endpoints shrink 4-8x)
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Static files
 app.mount("/static", StaticFiles(directory="web/static"), name="static")
 
 # Initialize scheduler
 scheduler = BlogScheduler()
 
+# Short-lived cache so dashboard polling of /tasks doesn't hit the
+# database on every request; keyed by the status filter
+_task_cache = TTLCache(maxsize=16, ttl=5)
+
+# Singletons initialized at startup so OpenAI/HTTP clients are built
+# once and reused across requests
+_generator: Optional[BlogGenerator] = None
+_publisher: Optional[BlogPublisher] = None
+
 # Request/Response models
 class BlogGenerationRequest(BaseModel):
     topic: str
@@ -57,17 +78,39 @@ class TaskResponse(BaseModel):
     result: Optional[dict] = None
     error_message: Optional[str] = None
 
+def _to_response(blog) -> BlogResponse:
+    """Build a BlogResponse from a BlogPost row.
+
+    model_construct skips re-validation of trusted database data, which
+    matters on the list endpoints.
+    """
+    return BlogResponse.model_construct(
+        id=blog.id,
+        title=blog.title,
+        slug=blog.slug,
+        status=blog.status,
+        created_at=blog.created_at,
+        published_date=blog.published_date,
+        url=f"{settings.blog_base_url}/{blog.slug}" if blog.status == "published" else None
+    )
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the application on startup"""
+    global _generator, _publisher
+
     logger.info("Starting Re-Defined Blog Automation System...")
-    
+
     # Initialize database
     init_database()
-    
+
+    # Initialize shared generator/publisher
+    _generator = BlogGenerator()
+    _publisher = BlogPublisher()
+
     # Start scheduler
     scheduler.start()
-    
+
     logger.info("Application started successfully!")
 
 @app.on_event("shutdown")
@@ -76,14 +119,20 @@ async def shutdown_event():
     logger.info("Shutting down application...")
     scheduler.stop()
 
+# Constant payload built once at import time
+_root_response = {
+    "message": "Re-Defined Blog Automation System",
+    "status": "running",
+    "version": "1.0.0"
+}
+
+# 1s cache so bursts of liveness probes trigger one real check
+_health_cache = TTLCache(maxsize=1, ttl=1)
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Re-Defined Blog Automation System",
-        "status": "running",
-        "version": "1.0.0"
-    }
+    return _root_response
 
 @app.post("/generate", response_model=BlogResponse)
 async def generate_blog(request: BlogGenerationRequest, background_tasks: BackgroundTasks):
@@ -96,7 +145,8 @@ async def generate_blog(request: BlogGenerationRequest, background_tasks: Backgr
                 scheduled_date=request.schedule_date,
                 custom_instructions=request.custom_instructions
             )
-            
+            _task_cache.clear()
+
             return BlogResponse(
                 id=task_id,
                 title=f"Scheduled: {request.topic}",
@@ -107,76 +157,65 @@ async def generate_blog(request: BlogGenerationRequest, background_tasks: Backgr
             )
         else:
             # Generate immediately
-            generator = BlogGenerator()
-            blog_post = generator.create_blog(
+            blog_post = _generator.create_blog(
                 topic=request.topic,
                 custom_instructions=request.custom_instructions
             )
-            
-            return BlogResponse(
-                id=blog_post.id,
-                title=blog_post.title,
-                slug=blog_post.slug,
-                status=blog_post.status,
-                created_at=blog_post.created_at,
-                published_date=blog_post.published_date,
-                url=f"https://re-defined.ca/blog/{blog_post.slug}" if blog_post.status == "published" else None
-            )
+
+            return _to_response(blog_post)
             
     except Exception as e:
         logger.error(f"Blog generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/blogs", response_model=List[BlogResponse])
-async def list_blogs(status: Optional[str] = None, limit: int = 20):
+async def list_blogs(
+    status: Optional[str] = None,
+    limit: int = 20,
+    session: AsyncSession = Depends(get_async_db)
+):
     """List blog posts"""
-    session = get_session()
-    query = session.query(BlogPost)
-    
+    # Select only the response columns to skip ORM instance hydration
+    query = select(
+        BlogPost.id,
+        BlogPost.title,
+        BlogPost.slug,
+        BlogPost.status,
+        BlogPost.created_at,
+        BlogPost.published_date
+    )
+
     if status:
-        query = query.filter_by(status=status)
-    
-    blogs = query.order_by(BlogPost.created_at.desc()).limit(limit).all()
-    
-    return [
-        BlogResponse(
-            id=blog.id,
-            title=blog.title,
-            slug=blog.slug,
-            status=blog.status,
-            created_at=blog.created_at,
-            published_date=blog.published_date,
-            url=f"https://re-defined.ca/blog/{blog.slug}" if blog.status == "published" else None
-        )
-        for blog in blogs
-    ]
+        query = query.filter(BlogPost.status == status)
+
+    result = await session.execute(
+        query.order_by(BlogPost.created_at.desc()).limit(limit)
+    )
+    blogs = result.all()
+
+    return [_to_response(blog) for blog in blogs]
 
 @app.get("/blogs/{blog_id}", response_model=BlogResponse)
-async def get_blog(blog_id: str):
+async def get_blog(blog_id: str, session: AsyncSession = Depends(get_async_db)):
     """Get a specific blog post"""
-    session = get_session()
-    blog = session.query(BlogPost).filter_by(id=blog_id).first()
-    
+    result = await session.execute(
+        select(BlogPost).options(
+            selectinload(BlogPost.sources),
+            selectinload(BlogPost.generation_data)
+        ).filter_by(id=blog_id)
+    )
+    blog = result.scalars().first()
+
     if not blog:
         raise HTTPException(status_code=404, detail="Blog post not found")
-    
-    return BlogResponse(
-        id=blog.id,
-        title=blog.title,
-        slug=blog.slug,
-        status=blog.status,
-        created_at=blog.created_at,
-        published_date=blog.published_date,
-        url=f"https://re-defined.ca/blog/{blog.slug}" if blog.status == "published" else None
-    )
+
+    return _to_response(blog)
 
 @app.post("/blogs/{blog_id}/publish")
 async def publish_blog(blog_id: str):
     """Publish a blog post"""
     try:
-        from src.publisher.publisher import BlogPublisher
-        publisher = BlogPublisher()
-        result = publisher.publish_blog(blog_id)
+        result = _publisher.publish_blog(blog_id)
         
         if result['success']:
             return {"message": "Blog published successfully", "url": result.get('url')}
@@ -194,11 +233,25 @@ async def scrape_trends(background_tasks: BackgroundTasks):
     return {"message": "Trend scraping started"}
 
 @app.get("/tasks", response_model=List[TaskResponse])
-async def list_tasks(status: Optional[str] = None):
+async def list_tasks(
+    status: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_db)
+):
     """List scheduled tasks"""
-    tasks = scheduler.get_scheduled_tasks(status)
-    
-    return [
+    if status in _task_cache:
+        return _task_cache[status]
+
+    query = select(ScheduledTask)
+
+    if status:
+        query = query.filter_by(status=status)
+
+    result = await session.execute(
+        query.order_by(ScheduledTask.scheduled_for.desc())
+    )
+    tasks = result.scalars().all()
+
+    responses = [
         TaskResponse(
             id=task.id,
             task_type=task.task_type,
@@ -209,13 +262,17 @@ async def list_tasks(status: Optional[str] = None):
         )
         for task in tasks
     ]
+    _task_cache[status] = responses
+
+    return responses
 
 @app.post("/tasks/{task_id}/retry")
 async def retry_task(task_id: str):
     """Retry a failed task"""
     success = scheduler.retry_failed_task(task_id)
-    
+
     if success:
+        _task_cache.clear()
         return {"message": "Task scheduled for retry"}
     else:
         raise HTTPException(status_code=400, detail="Cannot retry this task")
@@ -223,11 +280,17 @@ async def retry_task(task_id: str):
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
+    if "health" in _health_cache:
+        return _health_cache["health"]
+
+    payload = {
         "status": "healthy",
         "database": "connected",
         "scheduler": "running" if scheduler.scheduler.running else "stopped"
     }
+    _health_cache["health"] = payload
+
+    return payload
 
 if __name__ == "__main__":
     import uvicorn
@@ -240,11 +303,16 @@ if __name__ == "__main__":
         level=settings.log_level
     )
     
-    # Run the application
+    # Run the application (uvloop + httptools cut per-request overhead;
+    # multiple workers saturate the available cores in production)
+    is_prod = settings.env == "prod"
     uvicorn.run(
         "app:app",
         host=settings.app_host,
         port=settings.app_port,
-        reload=True,
+        workers=settings.uvicorn_workers if is_prod else 1,
+        loop="uvloop",
+        http="httptools",
+        reload=not is_prod,
         log_level=settings.log_level.lower()
-    ) 
\ No newline at end of file
+    )
\ No newline at end of file
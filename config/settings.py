@@ -13,14 +13,37 @@ class Settings:
     
     # Database
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./re_defined_blogs.db")
+
+    # Async database URL derived from database_url (asyncpg for Postgres,
+    # aiosqlite for SQLite) so async endpoints don't block the event loop
+    @property
+    def database_url_async(self):
+        url = self.database_url
+        if url.startswith("postgresql+asyncpg://") or url.startswith("sqlite+aiosqlite://"):
+            return url
+        if url.startswith("postgresql://"):
+            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        if url.startswith("postgres://"):
+            return url.replace("postgres://", "postgresql+asyncpg://", 1)
+        if url.startswith("sqlite://"):
+            return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        return url
+
+    # Connection pool tuning
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
     
     # OpenAI
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
     
     # Web Application
+    env: str = os.getenv("ENV", "dev")
     app_host: str = os.getenv("APP_HOST", "127.0.0.1")
     app_port: int = int(os.getenv("APP_PORT", "8000"))
+    uvicorn_workers: int = int(os.getenv("UVICORN_WORKERS", "0")) or (os.cpu_count() * 2 + 1)
     secret_key: str = os.getenv("SECRET_KEY", "local-dev-secret-key")
     
     # Static files and templates
@@ -30,27 +53,36 @@ class Settings:
     # Logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     logs_path: Path = Path("logs")
+
+    # On-disk caches (compiled templates, etc.)
+    cache_path: Path = Path(os.getenv("CACHE_PATH", ".cache"))
     
     # Content Settings
     min_word_count: int = int(os.getenv("MIN_WORD_COUNT", "300"))
     max_word_count: int = int(os.getenv("MAX_WORD_COUNT", "600"))
     
-    # Blog tone as list (split comma-separated string)
-    @property
-    def blog_tone(self):
-        tone_str = os.getenv("BLOG_TONE", "friendly,supportive,informative,community-focused")
-        return [tone.strip() for tone in tone_str.split(",")]
+    # Blog tone parsed once at startup (tuple so it's hashable and safe
+    # to share across threads/workers)
+    blog_tone: tuple = tuple(
+        tone.strip()
+        for tone in os.getenv("BLOG_TONE", "friendly,supportive,informative,community-focused").split(",")
+    )
     
     # SEO
     default_meta_description_length: int = int(os.getenv("DEFAULT_META_DESCRIPTION_LENGTH", "160"))
+
+    # Enable the slower YAKE statistical extraction as a fallback when the
+    # target-keyword scan leaves keyword slots unfilled
+    seo_use_yake: bool = os.getenv("SEO_USE_YAKE", "false").lower() in ("true", "1", "yes")
     
-    # Target keywords as list (split comma-separated string)
-    @property
-    def target_keywords(self):
-        keywords_str = os.getenv("TARGET_KEYWORDS", "international students,career development,job search,networking")
-        return [keyword.strip() for keyword in keywords_str.split(",")]
+    # Target keywords parsed once at startup
+    target_keywords: tuple = tuple(
+        keyword.strip()
+        for keyword in os.getenv("TARGET_KEYWORDS", "international students,career development,job search,networking").split(",")
+    )
     
     # Publishing
+    blog_base_url: str = os.getenv("BLOG_BASE_URL", "https://re-defined.ca/blog")
     publish_interval_days: int = int(os.getenv("PUBLISH_INTERVAL_DAYS", "14"))
     website_api_endpoint: str = os.getenv("WEBSITE_API_ENDPOINT", "")
     website_api_key: str = os.getenv("WEBSITE_API_KEY", "")
@@ -14,7 +14,10 @@ import sys
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from src.database.models import BlogPost, ScheduledTask, TrendingTopic
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import selectinload
+
+from src.database.models import BlogCount, BlogPost, ScheduledTask, TrendingTopic
 from src.database.init_db import get_session
 from config.settings import settings
 
@@ -65,36 +68,77 @@ page = st.sidebar.selectbox(
     ["📊 Dashboard", "✍️ Generate Blog", "📰 Blog Posts", "📈 Analytics", "⚙️ Settings"]
 )
 
-# Database session
+# Database session: get_session() hands out a thread-scoped session
+# from the shared engine, so each rerun reuses its thread's session
+# without leaking connections or sharing one Session across users
 session = get_session()
 
+# Cached read helpers so Streamlit reruns render from memory instead of
+# re-querying the database on every widget interaction
+@st.cache_data(ttl=60)
+def load_dashboard_metrics():
+    """Load the metric-row counts in a single round-trip"""
+    row = session.execute(
+        select(
+            # Blog totals come from the denormalized blog_counts table
+            # (O(1) rows) instead of COUNT(*) scans over blog_posts
+            select(func.coalesce(func.sum(BlogCount.n), 0))
+                .scalar_subquery().label('total_blogs'),
+            select(func.coalesce(func.sum(BlogCount.n), 0))
+                .where(BlogCount.status == "published")
+                .scalar_subquery().label('published_blogs'),
+            select(func.count()).select_from(ScheduledTask)
+                .where(ScheduledTask.status == "pending")
+                .scalar_subquery().label('scheduled_tasks'),
+            select(func.count()).select_from(TrendingTopic)
+                .where(TrendingTopic.used_in_post == False)
+                .scalar_subquery().label('trending_topics')
+        )
+    ).one()
+
+    return dict(row._mapping)
+
+@st.cache_data(ttl=60)
+def load_upcoming_tasks(limit: int = 5):
+    """Load upcoming scheduled tasks as plain rows"""
+    tasks = session.query(ScheduledTask).filter(
+        ScheduledTask.status.in_(["pending", "running"])
+    ).order_by(ScheduledTask.scheduled_for).limit(limit).all()
+
+    return [
+        {
+            "Type": task.task_type,
+            "Scheduled": task.scheduled_for.strftime('%Y-%m-%d %H:%M'),
+            "Status": task.status,
+            "Details": task.parameters.get('description', 'N/A') if task.parameters else 'N/A'
+        }
+        for task in tasks
+    ]
+
 if page == "📊 Dashboard":
     st.header("Dashboard Overview")
-    
+
     # Metrics row
+    metrics = load_dashboard_metrics()
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        total_blogs = session.query(BlogPost).count()
-        st.metric("Total Blogs", total_blogs)
-    
+        st.metric("Total Blogs", metrics['total_blogs'])
+
     with col2:
-        published_blogs = session.query(BlogPost).filter_by(status="published").count()
-        st.metric("Published", published_blogs)
-    
+        st.metric("Published", metrics['published_blogs'])
+
     with col3:
-        scheduled_tasks = session.query(ScheduledTask).filter_by(status="pending").count()
-        st.metric("Scheduled Tasks", scheduled_tasks)
-    
+        st.metric("Scheduled Tasks", metrics['scheduled_tasks'])
+
     with col4:
-        trending_topics = session.query(TrendingTopic).filter_by(used_in_post=False).count()
-        st.metric("Available Trends", trending_topics)
-    
+        st.metric("Available Trends", metrics['trending_topics'])
+
     # Recent activity
     st.subheader("📅 Recent Activity")
-    
+
     recent_blogs = session.query(BlogPost).order_by(BlogPost.created_at.desc()).limit(5).all()
-    
+
     for blog in recent_blogs:
         with st.expander(f"{blog.title} - {blog.status.upper()}"):
             col1, col2 = st.columns([3, 1])
@@ -116,21 +160,10 @@ if page == "📊 Dashboard":
     
     # Upcoming tasks
     st.subheader("🔄 Scheduled Tasks")
-    
-    upcoming_tasks = session.query(ScheduledTask).filter(
-        ScheduledTask.status.in_(["pending", "running"])
-    ).order_by(ScheduledTask.scheduled_for).limit(5).all()
-    
-    if upcoming_tasks:
-        task_data = []
-        for task in upcoming_tasks:
-            task_data.append({
-                "Type": task.task_type,
-                "Scheduled": task.scheduled_for.strftime('%Y-%m-%d %H:%M'),
-                "Status": task.status,
-                "Details": task.parameters.get('description', 'N/A') if task.parameters else 'N/A'
-            })
-        
+
+    task_data = load_upcoming_tasks()
+
+    if task_data:
         df = pd.DataFrame(task_data)
         st.dataframe(df, use_container_width=True)
     else:
@@ -198,21 +231,46 @@ elif page == "📰 Blog Posts":
     with col3:
         search_query = st.text_input("Search", placeholder="Search by title...")
     
-    # Query blogs
-    query = session.query(BlogPost)
-    
+    # Query blogs (only the columns the list rendering reads)
+    query = session.query(
+        BlogPost.id,
+        BlogPost.title,
+        BlogPost.status,
+        BlogPost.created_at,
+        BlogPost.word_count
+    )
+
     if status_filter != "All":
-        query = query.filter_by(status=status_filter.lower())
+        query = query.filter(BlogPost.status == status_filter.lower())
     
     if search_query:
-        query = query.filter(BlogPost.title.contains(search_query))
+        # Escape LIKE wildcards so user input matches literally; ILIKE
+        # is answered from the trigram index on Postgres
+        escaped = search_query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        query = query.filter(BlogPost.title.ilike(f"%{escaped}%", escape='\\'))
     
     query = query.filter(BlogPost.created_at >= date_filter)
-    
-    blogs = query.order_by(BlogPost.created_at.desc()).all()
-    
+
+    # Paginate so only one page of rows is fetched and rendered
+    PAGE_SIZE = 25
+
+    @st.cache_data(ttl=30)
+    def count_filtered_blogs(status, search, from_date):
+        """Count blogs matching the current filters"""
+        return query.with_entities(func.count(BlogPost.id)).scalar()
+
+    total_blogs = count_filtered_blogs(status_filter, search_query, date_filter)
+    total_pages = max(1, -(-total_blogs // PAGE_SIZE))
+
+    page_number = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
+
+    blogs = query.order_by(BlogPost.created_at.desc())\
+        .offset((page_number - 1) * PAGE_SIZE)\
+        .limit(PAGE_SIZE)\
+        .all()
+
     # Display blogs
-    st.write(f"Found {len(blogs)} blog posts")
+    st.write(f"Found {total_blogs} blog posts (page {page_number} of {total_pages})")
     
     for blog in blogs:
         with st.container():
@@ -247,7 +305,10 @@ elif page == "📰 Blog Posts":
     # Blog detail view
     if 'selected_blog' in st.session_state:
         blog_id = st.session_state['selected_blog']
-        blog = session.query(BlogPost).filter_by(id=blog_id).first()
+        blog = session.query(BlogPost).options(
+            selectinload(BlogPost.sources),
+            selectinload(BlogPost.generation_data)
+        ).filter_by(id=blog_id).first()
         
         if blog:
             st.subheader(f"📄 {blog.title}")
@@ -286,20 +347,24 @@ elif page == "📈 Analytics":
     # Blog creation over time
     st.subheader("📊 Blog Creation Timeline")
     
-    blogs_timeline = session.query(
-        BlogPost.created_at,
-        BlogPost.status
-    ).filter(
-        BlogPost.created_at.between(start_date, end_date)
-    ).all()
-    
+    @st.cache_data(ttl=60)
+    def load_blog_timeline(start, end):
+        """Load per-day blog counts by status, bucketed in SQL"""
+        # func.date truncates to the day on both SQLite and Postgres;
+        # CAST AS DATE is a numeric cast on SQLite and breaks decoding
+        return session.query(
+            func.date(BlogPost.created_at).label('date'),
+            BlogPost.status,
+            func.count().label('count')
+        ).filter(
+            BlogPost.created_at.between(start, end)
+        ).group_by('date', BlogPost.status).all()
+
+    blogs_timeline = load_blog_timeline(start_date, end_date)
+
     if blogs_timeline:
-        df = pd.DataFrame(blogs_timeline)
-        df['date'] = pd.to_datetime(df['created_at']).dt.date
-        
-        # Group by date and status
-        timeline_data = df.groupby(['date', 'status']).size().reset_index(name='count')
-        
+        timeline_data = pd.DataFrame(blogs_timeline, columns=['date', 'status', 'count'])
+
         fig = px.line(timeline_data, x='date', y='count', color='status',
                      title='Blogs Created Over Time')
         st.plotly_chart(fig, use_container_width=True)
@@ -310,18 +375,19 @@ elif page == "📈 Analytics":
     with col1:
         st.subheader("📊 Status Distribution")
         
-        status_counts = session.query(
-            BlogPost.status,
-            BlogPost.id
-        ).group_by(BlogPost.status).all()
-        
+        @st.cache_data(ttl=60)
+        def load_status_counts():
+            """Load per-status blog counts"""
+            return session.query(
+                BlogPost.status,
+                func.count(BlogPost.id)
+            ).group_by(BlogPost.status).all()
+
+        status_counts = load_status_counts()
+
         if status_counts:
-            status_df = pd.DataFrame(
-                [(s[0], len(list(filter(lambda x: x[0] == s[0], status_counts)))) 
-                 for s in set(status_counts)],
-                columns=['Status', 'Count']
-            )
-            
+            status_df = pd.DataFrame(status_counts, columns=['Status', 'Count'])
+
             fig = px.pie(status_df, values='Count', names='Status', 
                         title='Blog Status Distribution')
             st.plotly_chart(fig, use_container_width=True)
@@ -329,10 +395,15 @@ elif page == "📈 Analytics":
     with col2:
         st.subheader("📊 Word Count Distribution")
         
-        word_counts = session.query(BlogPost.word_count).filter(
-            BlogPost.word_count.isnot(None)
-        ).all()
-        
+        @st.cache_data(ttl=60)
+        def load_word_counts():
+            """Load word counts for the histogram"""
+            return session.query(BlogPost.word_count).filter(
+                BlogPost.word_count.isnot(None)
+            ).all()
+
+        word_counts = load_word_counts()
+
         if word_counts:
             wc_df = pd.DataFrame(word_counts, columns=['Word Count'])
             
@@ -340,24 +411,36 @@ elif page == "📈 Analytics":
                              title='Word Count Distribution')
             st.plotly_chart(fig, use_container_width=True)
     
-    # Top performing keywords
+    # Top performing keywords (aggregated in SQL so only the top 20
+    # rows travel over the wire instead of every keyword JSON blob)
     st.subheader("🔑 Top Keywords")
-    
-    all_keywords = []
-    blogs_with_keywords = session.query(BlogPost.keywords).filter(
-        BlogPost.keywords.isnot(None)
-    ).all()
-    
-    for blog in blogs_with_keywords:
-        if blog.keywords:
-            all_keywords.extend(blog.keywords)
-    
-    if all_keywords:
-        keyword_counts = pd.Series(all_keywords).value_counts().head(20)
-        
-        fig = px.bar(x=keyword_counts.values, y=keyword_counts.index,
+
+    if session.get_bind().dialect.name == "postgresql":
+        keyword_sql = text(
+            "SELECT kw AS keyword, COUNT(*) AS frequency "
+            "FROM blog_posts, jsonb_array_elements_text(keywords::jsonb) AS kw "
+            "GROUP BY kw ORDER BY frequency DESC LIMIT 20"
+        )
+    else:  # SQLite
+        keyword_sql = text(
+            "SELECT je.value AS keyword, COUNT(*) AS frequency "
+            "FROM blog_posts, json_each(blog_posts.keywords) AS je "
+            "WHERE blog_posts.keywords IS NOT NULL "
+            "GROUP BY je.value ORDER BY frequency DESC LIMIT 20"
+        )
+
+    @st.cache_data(ttl=60)
+    def load_top_keywords(sql):
+        """Load the top-20 keyword counts"""
+        return session.execute(text(sql)).all()
+
+    top_keywords = load_top_keywords(str(keyword_sql))
+
+    if top_keywords:
+        keyword_df = pd.DataFrame(top_keywords, columns=['Keyword', 'Frequency'])
+
+        fig = px.bar(keyword_df, x='Frequency', y='Keyword',
                     orientation='h', title='Most Used Keywords')
-        fig.update_layout(xaxis_title="Frequency", yaxis_title="Keyword")
         st.plotly_chart(fig, use_container_width=True)
 
 elif page == "⚙️ Settings":
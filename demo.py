@@ -14,18 +14,21 @@ load_dotenv()
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from src.database.init_db import init_database
-from src.content_generator.generator import BlogGenerator
-from src.scraper.trend_scraper import TrendScraper
-from src.image_generator.generator import ImageGenerator
-from src.seo_optimizer.optimizer import SEOOptimizer
-from src.publisher.publisher import BlogPublisher
-from src.scheduler.scheduler import BlogScheduler
 from loguru import logger
 
+# Heavy modules (openai, tiktoken, Pillow, apscheduler) are imported
+# inside each demo function so e.g. the DB-only analytics demo doesn't
+# pay their cold-start import cost
+
 def demo_blog_generation():
     """Demonstrate blog generation workflow"""
-    
+    from src.database.init_db import get_session, init_database
+    from src.content_generator.generator import BlogGenerator
+    from src.scraper.trend_scraper import TrendScraper
+    from src.image_generator.generator import ImageGenerator
+    from src.seo_optimizer.optimizer import SEOOptimizer
+    from src.publisher.publisher import BlogPublisher
+
     print("🚀 Re-Defined Blog Automation System Demo")
     print("=" * 50)
     
@@ -33,6 +36,9 @@ def demo_blog_generation():
     print("\n1️⃣ Initializing database...")
     init_database()
     print("✅ Database initialized")
+
+    # One session shared by every step of the demo workflow
+    session = get_session()
     
     # Step 2: Scrape trending topics
     print("\n2️⃣ Scraping trending topics...")
@@ -72,7 +78,8 @@ def demo_blog_generation():
         topic=topic,
         trending_data=trending_data,
         sources=sources[:3],
-        custom_instructions="Focus on practical, actionable advice. Include statistics where relevant."
+        custom_instructions="Focus on practical, actionable advice. Include statistics where relevant.",
+        session=session
     )
     
     print(f"✅ Blog generated: {blog_post.title}")
@@ -96,13 +103,11 @@ def demo_blog_generation():
     print(f"✅ Thumbnail generated: {thumbnail_path}")
     print(f"✅ Banner generated: {banner_path}")
     
-    # Update blog with images
-    from src.database.init_db import get_session
-    session = get_session()
+    # Update blog with images (committed together with the SEO updates
+    # below so the demo does one fsync instead of one per step)
     blog_post.thumbnail_url = thumbnail_path
     blog_post.banner_image_url = banner_path
-    session.commit()
-    
+
     # Step 5: SEO optimization
     print("\n5️⃣ Optimizing for SEO...")
     seo = SEOOptimizer()
@@ -124,7 +129,8 @@ def demo_blog_generation():
         for rec in seo_score['recommendations'][:3]:
             print(f"   - {rec}")
     
-    # Update blog with SEO optimizations
+    # Update blog with SEO optimizations; one commit flushes the image
+    # paths and SEO fields in a single transaction
     blog_post.meta_description = optimizations['meta_description']
     blog_post.keywords = optimizations['keywords']
     session.commit()
@@ -158,7 +164,9 @@ def demo_scheduling():
     
     print("\n\n🗓️ Scheduling Demo")
     print("=" * 50)
-    
+
+    from src.scheduler.scheduler import BlogScheduler
+
     scheduler = BlogScheduler()
     
     # Schedule a custom blog for next week
@@ -187,23 +195,34 @@ def demo_analytics():
     print("\n\n📊 Analytics Demo")
     print("=" * 50)
     
+    from sqlalchemy import func
     from src.database.init_db import get_session
     from src.database.models import BlogPost
-    
+
     session = get_session()
-    
-    # Get blog statistics
-    total_blogs = session.query(BlogPost).count()
-    published_blogs = session.query(BlogPost).filter_by(status="published").count()
-    draft_blogs = session.query(BlogPost).filter_by(status="draft").count()
+
+    # Get blog statistics with one grouped query instead of a COUNT(*)
+    # round-trip per status
+    status_counts = dict(
+        session.query(BlogPost.status, func.count(BlogPost.id))
+        .group_by(BlogPost.status).all()
+    )
+    total_blogs = sum(status_counts.values())
+    published_blogs = status_counts.get("published", 0)
+    draft_blogs = status_counts.get("draft", 0)
     
     print(f"\n📈 Blog Statistics:")
     print(f"  - Total blogs: {total_blogs}")
     print(f"  - Published: {published_blogs}")
     print(f"  - Drafts: {draft_blogs}")
     
-    # Recent blogs
-    recent_blogs = session.query(BlogPost).order_by(BlogPost.created_at.desc()).limit(3).all()
+    # Recent blogs (defer the large content/summary columns; only the
+    # title and status are printed)
+    from sqlalchemy.orm import load_only
+
+    recent_blogs = session.query(BlogPost).options(
+        load_only(BlogPost.title, BlogPost.status, BlogPost.created_at)
+    ).order_by(BlogPost.created_at.desc()).limit(3).all()
     
     if recent_blogs:
         print(f"\n📝 Recent Blogs:")
@@ -1,11 +1,16 @@
 """
 AI-powered blog content generator for Re-Defined
 """
-import json
+import asyncio
+import orjson
+import re
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 from loguru import logger
 import tiktoken
 from src.database.models import BlogPost, Source, GenerationData
@@ -13,30 +18,60 @@ from src.database.init_db import get_session
 from config.settings import settings
 from src.utils.text_utils import generate_slug, count_words, estimate_reading_time
 
+# Tone keywords and a precompiled alternation so tone analysis is one
+# regex pass over the content instead of a substring scan per keyword
+_TONE_KEYWORDS = {
+    'friendly': frozenset(['welcome', 'help', 'support', 'together', 'community']),
+    'supportive': frozenset(['guide', 'assist', 'encourage', 'believe', 'achieve']),
+    'informative': frozenset(['learn', 'discover', 'understand', 'explain', 'insight']),
+    'professional': frozenset(['career', 'opportunity', 'develop', 'growth', 'success'])
+}
+
+# Fallback keywords for responses that fail JSON parsing
+_DEFAULT_KEYWORDS = ("international students", "career", "education")
+
+_TONE_KEYWORD_RE = re.compile(
+    "|".join(sorted(
+        (keyword for keywords in _TONE_KEYWORDS.values() for keyword in keywords),
+        key=len, reverse=True
+    ))
+)
+
+@lru_cache(maxsize=4)
+def _get_encoder(model: str):
+    """Load the tiktoken encoder for a model once per process"""
+    return tiktoken.encoding_for_model(model)
+
 class BlogGenerator:
     """Generates blog content using OpenAI GPT models"""
-    
+
     def __init__(self):
         self.client = OpenAI(api_key=settings.openai_api_key)
+        self.aclient = AsyncOpenAI(api_key=settings.openai_api_key)
         self.model = settings.openai_model
-        self.encoder = tiktoken.encoding_for_model(self.model)
+        self.encoder = _get_encoder(self.model)
+        # Compose the system prompt once; it only depends on settings
+        self.system_prompt = self._build_system_prompt()
         
     def create_blog(
         self,
         topic: str,
         trending_data: Optional[Dict] = None,
         sources: Optional[List[Dict]] = None,
-        custom_instructions: Optional[str] = None
+        custom_instructions: Optional[str] = None,
+        session: Optional[Session] = None
     ) -> BlogPost:
         """
         Generate a complete blog post
-        
+
         Args:
             topic: Main topic for the blog
             trending_data: Data from trending topics research
             sources: List of sources to cite
             custom_instructions: Additional instructions for content generation
-            
+            session: Existing database session to reuse (a new one is
+                opened if not provided)
+
         Returns:
             BlogPost object ready for publishing
         """
@@ -59,26 +94,34 @@ class BlogGenerator:
             status="draft"
         )
         
-        # Save to database
-        session = get_session()
+        # Save to database (reusing the caller's session when given so a
+        # multi-step workflow shares one connection and transaction)
+        if session is None:
+            session = get_session()
         session.add(blog_post)
-        
-        # Add sources if provided
+
+        # Flush so the generated blog post ID is available for FK rows
+        session.flush()
+
+        # Add sources if provided (single multi-row INSERT instead of
+        # one statement per citation)
         if sources:
-            for source_data in sources:
-                source = Source(
-                    blog_post_id=blog_post.id,
-                    source_type=source_data.get('type', 'article'),
-                    title=source_data.get('title'),
-                    author=source_data.get('author'),
-                    url=source_data.get('url'),
-                    publication_date=source_data.get('publication_date'),
-                    citation_text=source_data.get('citation_text'),
-                    credibility_score=source_data.get('credibility_score', 8),
-                    relevance_score=source_data.get('relevance_score', 8)
-                )
-                session.add(source)
-        
+            source_rows = [
+                {
+                    'blog_post_id': blog_post.id,
+                    'source_type': source_data.get('type', 'article'),
+                    'title': source_data.get('title'),
+                    'author': source_data.get('author'),
+                    'url': source_data.get('url'),
+                    'publication_date': source_data.get('publication_date'),
+                    'citation_text': source_data.get('citation_text'),
+                    'credibility_score': source_data.get('credibility_score', 8),
+                    'relevance_score': source_data.get('relevance_score', 8)
+                }
+                for source_data in sources
+            ]
+            session.execute(insert(Source), source_rows)
+
         # Add generation metadata
         generation_data = GenerationData(
             blog_post_id=blog_post.id,
@@ -86,7 +129,7 @@ class BlogGenerator:
             prompt_template=self._get_prompt_template(),
             temperature=0.8,
             generation_time=int(time.time() - start_time),
-            tokens_used=self._count_tokens(content_data['content']),
+            tokens_used=self._estimate_tokens(content_data['content']),
             search_queries=trending_data.get('search_queries', []) if trending_data else [],
             scraped_urls=trending_data.get('scraped_urls', []) if trending_data else [],
             trending_topics=trending_data.get('topics', []) if trending_data else []
@@ -111,26 +154,37 @@ class BlogGenerator:
         prompt = self._build_prompt(topic, trending_data, sources, custom_instructions)
         
         try:
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": self._get_system_prompt()},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.8,
-                max_tokens=1500
+                max_tokens=1500,
+                stream=True
             )
-            
-            # Parse the response
-            content = response.choices[0].message.content
-            return self._parse_blog_response(content)
-            
+
+            # Consume deltas as they arrive so parsing starts the moment
+            # the stream closes instead of after the full completion
+            # object is assembled server-side
+            chunks = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    chunks.append(chunk.choices[0].delta.content)
+
+            return self._parse_blog_response("".join(chunks))
+
         except Exception as e:
             logger.error(f"Failed to generate content: {e}")
             raise
     
     def _get_system_prompt(self) -> str:
-        """Get the system prompt for blog generation"""
+        """Get the cached system prompt for blog generation"""
+        return self.system_prompt
+
+    def _build_system_prompt(self) -> str:
+        """Compose the system prompt from settings"""
         tone_description = ", ".join(settings.blog_tone)
         return f"""You are a professional content writer for Re-Defined, a platform supporting international students and young professionals.
 
@@ -184,57 +238,57 @@ Format your response as a JSON object with the following structure:
     def _parse_blog_response(self, response: str) -> Dict[str, any]:
         """Parse the AI response into structured data"""
         try:
-            # Try to parse as JSON
-            data = json.loads(response)
-            
+            # Try to parse as JSON (orjson parses the content blob in C)
+            data = orjson.loads(response)
+
             # Validate required fields
             required_fields = ['title', 'content', 'summary', 'meta_description', 'keywords']
             for field in required_fields:
                 if field not in data:
                     raise ValueError(f"Missing required field: {field}")
-            
+
             return data
-            
-        except json.JSONDecodeError:
+
+        except orjson.JSONDecodeError:
             # If not valid JSON, try to extract content manually
             logger.warning("Response is not valid JSON, attempting manual parsing")
             return self._manual_parse_response(response)
     
     def _manual_parse_response(self, response: str) -> Dict[str, any]:
         """Manually parse response if JSON parsing fails"""
-        # This is a fallback method
-        lines = response.strip().split('\n')
-        
+        # This is a fallback method; partition splits head/tail in one
+        # C call instead of materializing every line
+        head, _, tail = response.strip().partition('\n')
+
         return {
-            'title': lines[0] if lines else "Untitled Blog Post",
-            'content': '\n'.join(lines[1:]) if len(lines) > 1 else response,
-            'summary': f"A blog post about {lines[0][:100]}..." if lines else "Blog summary",
-            'meta_description': lines[0][:160] if lines else "Blog post from Re-Defined",
-            'keywords': ["international students", "career", "education"]
+            'title': head or "Untitled Blog Post",
+            'content': tail or response,
+            'summary': f"A blog post about {head[:100]}..." if head else "Blog summary",
+            'meta_description': head[:160] if head else "Blog post from Re-Defined",
+            'keywords': list(_DEFAULT_KEYWORDS)
         }
     
     def _analyze_tone(self, content: str) -> Dict[str, float]:
         """Analyze the tone of the generated content"""
         # Simple tone analysis - could be enhanced with sentiment analysis
-        tone_keywords = {
-            'friendly': ['welcome', 'help', 'support', 'together', 'community'],
-            'supportive': ['guide', 'assist', 'encourage', 'believe', 'achieve'],
-            'informative': ['learn', 'discover', 'understand', 'explain', 'insight'],
-            'professional': ['career', 'opportunity', 'develop', 'growth', 'success']
+        found = set(_TONE_KEYWORD_RE.findall(content.lower()))
+
+        return {
+            tone: min(len(found & keywords) / len(keywords), 1.0)
+            for tone, keywords in _TONE_KEYWORDS.items()
         }
-        
-        content_lower = content.lower()
-        tone_scores = {}
-        
-        for tone, keywords in tone_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in content_lower)
-            tone_scores[tone] = min(score / len(keywords), 1.0)
-        
-        return tone_scores
     
     def _count_tokens(self, text: str) -> int:
         """Count the number of tokens in the text"""
         return len(self.encoder.encode(text))
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Cheap token estimate (~4 chars per token for English prose)
+
+        Good enough for the stored usage metric; use _count_tokens when
+        an exact count matters, e.g. to stay under a model limit.
+        """
+        return max(1, len(text) >> 2)
     
     def _get_prompt_template(self) -> str:
         """Get the prompt template for reference"""
@@ -269,7 +323,69 @@ Provide only the new section content, maintaining the same tone and style."""
             )
             
             return response.choices[0].message.content
-            
+
         except Exception as e:
             logger.error(f"Failed to regenerate section: {e}")
+            raise
+
+    async def regenerate_sections_async(
+        self,
+        blog_post_id: str,
+        sections: List[Tuple[str, str]],
+        max_concurrency: int = 5
+    ) -> List[str]:
+        """
+        Regenerate several sections of a blog post concurrently
+
+        All section prompts are submitted at once (bounded by a
+        semaphore to respect rate limits), so wall time is the slowest
+        request instead of the sum of all of them.
+
+        Args:
+            blog_post_id: ID of the blog post
+            sections: List of (section_name, instructions) pairs
+            max_concurrency: Maximum in-flight OpenAI requests
+
+        Returns:
+            New section contents, in the same order as `sections`
+        """
+        session = get_session()
+        blog_post = session.query(BlogPost).filter_by(id=blog_post_id).first()
+
+        if not blog_post:
+            raise ValueError(f"Blog post not found: {blog_post_id}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _regenerate(section: str, instructions: str) -> str:
+            prompt = f"""Given this blog post titled "{blog_post.title}", regenerate the {section} section.
+
+Current content:
+{blog_post.content}
+
+Instructions for the new {section} section: {instructions}
+
+Provide only the new section content, maintaining the same tone and style."""
+
+            async with semaphore:
+                response = await self.aclient.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": self._get_system_prompt()},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.8,
+                    max_tokens=500
+                )
+
+            return response.choices[0].message.content
+
+        try:
+            return await asyncio.gather(*(
+                _regenerate(section, instructions)
+                for section, instructions in sections
+            ))
+
+        except Exception as e:
+            logger.error(f"Failed to regenerate sections: {e}")
             raise 
\ No newline at end of file
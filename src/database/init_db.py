@@ -2,36 +2,109 @@
 Database initialization script
 """
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from src.database.models import Base
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.database.models import Base, BlogCount, BlogPost
 from config.settings import settings
 from loguru import logger
 
+def _pool_kwargs():
+    """Connection pool settings for the shared engine"""
+    kwargs = {"pool_pre_ping": True}
+
+    # SQLite uses its own pooling; QueuePool sizing only applies to
+    # client/server databases like Postgres
+    if not settings.database_url.startswith("sqlite"):
+        kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+
+    return kwargs
+
+# One shared engine per process instead of reconstructing per call.
+# scoped_session hands repeated get_session() calls on the same thread
+# the same session instead of a fresh one each time.
+engine = create_engine(settings.database_url, **_pool_kwargs())
+SessionLocal = scoped_session(sessionmaker(bind=engine))
+
+if settings.database_url.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, connection_record):
+        """WAL + relaxed fsync so commits append to the log instead of
+        rewriting the journal, and temp/spill work stays in memory"""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+# Async engine/session factory for the FastAPI endpoints so DB calls
+# don't block the event loop
+async_engine = create_async_engine(settings.database_url_async, pool_pre_ping=True)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 def init_database():
     """Initialize the database and create all tables"""
     try:
-        # Create engine
-        engine = create_engine(settings.database_url, echo=True)
-        
         # Create all tables
         Base.metadata.create_all(engine)
-        
+
+        # Reseed the denormalized per-status counts from existing rows
+        with engine.begin() as conn:
+            conn.execute(BlogCount.__table__.delete())
+            conn.execute(
+                BlogCount.__table__.insert().from_select(
+                    ['status', 'n'],
+                    select(BlogPost.status, func.count()).group_by(BlogPost.status)
+                )
+            )
+
         logger.info(f"Database initialized successfully at {settings.database_url}")
         return engine
-        
+
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
 def get_session():
-    """Get a database session"""
-    engine = create_engine(settings.database_url)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Get a database session from the shared engine"""
+    return SessionLocal()
+
+@contextmanager
+def session_scope():
+    """Transactional scope: commit on success, roll back on error, and
+    always close so background threads don't hold connections open"""
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+def get_db():
+    """FastAPI dependency yielding a session closed with the request"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    """FastAPI dependency yielding a request-scoped AsyncSession"""
+    async with AsyncSessionLocal() as session:
+        yield session
 
 if __name__ == "__main__":
     init_database() 
\ No newline at end of file
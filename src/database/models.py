@@ -3,25 +3,52 @@ Database models for Re-Defined Blog Automation System
 """
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON
+from sqlalchemy import create_engine, Column, Integer, Float, String, Text, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy import event, inspect
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from sqlalchemy.dialects.postgresql import UUID
+import orjson
 import uuid
 
 Base = declarative_base()
 
+class ORJSON(TypeDecorator):
+    """JSON column that serializes with orjson instead of stdlib json,
+    cutting per-row encode/decode CPU on every read and write"""
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return orjson.dumps(value).decode() if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return orjson.loads(value) if value else None
+
 class BlogPost(Base):
     """Model for blog posts"""
     __tablename__ = "blog_posts"
-    
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    __table_args__ = (
+        # Covers the common filter/sort pattern (status, created_at DESC)
+        Index('ix_blog_posts_status_created', 'status', 'created_at'),
+        # Date-only range filters and newest-first listings without a
+        # status filter scan this one backwards
+        Index('ix_blog_posts_created_at', 'created_at'),
+        # Trigram index so ILIKE '%...%' title search is index-backed on
+        # Postgres (requires the pg_trgm extension; ignored on SQLite)
+        Index('ix_blog_posts_title_trgm', 'title',
+              postgresql_using='gin',
+              postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: uuid.uuid4().hex)
     title = Column(String(200), nullable=False)
     slug = Column(String(250), unique=True, nullable=False)
     content = Column(Text, nullable=False)
     summary = Column(Text)
     meta_description = Column(String(160))
-    keywords = Column(JSON)  # List of keywords
+    keywords = Column(ORJSON)  # List of keywords
     
     # Thumbnail and images
     thumbnail_url = Column(String)
@@ -30,7 +57,7 @@ class BlogPost(Base):
     # Content metadata
     word_count = Column(Integer)
     reading_time = Column(Integer)  # in minutes
-    tone_analysis = Column(JSON)  # Analysis of tone/style
+    tone_analysis = Column(ORJSON)  # Analysis of tone/style
     
     # Publishing info
     status = Column(String(50), default="draft")  # draft, scheduled, published, failed
@@ -50,7 +77,7 @@ class Source(Base):
     """Model for content sources and citations"""
     __tablename__ = "sources"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=lambda: uuid.uuid4().hex)
     blog_post_id = Column(String, ForeignKey("blog_posts.id"))
     
     source_type = Column(String(50))  # article, website, social_media, research
@@ -76,18 +103,18 @@ class GenerationData(Base):
     """Model for storing AI generation metadata"""
     __tablename__ = "generation_data"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=lambda: uuid.uuid4().hex)
     blog_post_id = Column(String, ForeignKey("blog_posts.id"), unique=True)
     
     # Generation parameters
     model_used = Column(String(100))
     prompt_template = Column(Text)
-    temperature = Column(Integer)
+    temperature = Column(Float)
     
     # Research data
-    search_queries = Column(JSON)  # List of queries used
-    scraped_urls = Column(JSON)  # List of URLs scraped
-    trending_topics = Column(JSON)  # Topics identified as trending
+    search_queries = Column(ORJSON)  # List of queries used
+    scraped_urls = Column(ORJSON)  # List of URLs scraped
+    trending_topics = Column(ORJSON)  # Topics identified as trending
     
     # Performance metrics
     generation_time = Column(Integer)  # in seconds
@@ -102,7 +129,7 @@ class ScheduledTask(Base):
     """Model for scheduling blog generation and publishing"""
     __tablename__ = "scheduled_tasks"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=lambda: uuid.uuid4().hex)
     task_type = Column(String(50))  # generate, publish, scrape
     status = Column(String(50), default="pending")  # pending, running, completed, failed
     
@@ -111,19 +138,62 @@ class ScheduledTask(Base):
     completed_at = Column(DateTime)
     
     # Task data
-    parameters = Column(JSON)
-    result = Column(JSON)
+    parameters = Column(ORJSON)
+    result = Column(ORJSON)
     error_message = Column(Text)
     retry_count = Column(Integer, default=0)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class BlogCount(Base):
+    """Denormalized per-status blog counts, maintained by ORM events so
+    dashboards read K tiny rows instead of COUNT(*) scanning the table"""
+    __tablename__ = "blog_counts"
+
+    status = Column(String(50), primary_key=True)
+    n = Column(Integer, default=0, nullable=False)
+
+def _bump_blog_count(connection, status, delta):
+    """Apply a +/- delta to the counter row for a status"""
+    table = BlogCount.__table__
+    result = connection.execute(
+        table.update().where(table.c.status == status).values(n=table.c.n + delta)
+    )
+
+    if result.rowcount == 0 and delta > 0:
+        connection.execute(table.insert().values(status=status, n=delta))
+
+@event.listens_for(BlogPost, "after_insert")
+def _blog_post_inserted(mapper, connection, target):
+    _bump_blog_count(connection, target.status, 1)
+
+@event.listens_for(BlogPost, "after_update")
+def _blog_post_updated(mapper, connection, target):
+    history = inspect(target).attrs.status.history
+
+    if history.has_changes() and history.deleted:
+        old_status = history.deleted[0]
+        if old_status != target.status:
+            _bump_blog_count(connection, old_status, -1)
+            _bump_blog_count(connection, target.status, 1)
+
+@event.listens_for(BlogPost, "after_delete")
+def _blog_post_deleted(mapper, connection, target):
+    _bump_blog_count(connection, target.status, -1)
+
 class TrendingTopic(Base):
     """Model for storing trending topics from various sources"""
     __tablename__ = "trending_topics"
-    
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    __table_args__ = (
+        # Backs the claim query: WHERE used_in_post = false
+        # ORDER BY relevance_score DESC, discovered_at DESC LIMIT n
+        Index('ix_trending_topics_unused_rank',
+              'used_in_post', 'relevance_score', 'discovered_at'),
+    )
+
+
+    id = Column(String, primary_key=True, default=lambda: uuid.uuid4().hex)
     source = Column(String(100))  # linkedin, forbes, news, etc.
     topic = Column(String(300))
     description = Column(Text)
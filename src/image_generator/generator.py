@@ -2,7 +2,13 @@
 Image generator for blog thumbnails and banners
 """
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple
+import numpy as np
+from cachetools import LFUCache
 from PIL import Image, ImageDraw, ImageFont
 import requests
 from io import BytesIO
@@ -10,6 +16,18 @@ from loguru import logger
 from pathlib import Path
 from config.settings import settings
 
+# Strips filename-unsafe characters in one compiled-regex pass
+_FILENAME_SANITIZE_RE = re.compile(r'[^a-z0-9 _-]+')
+
+# Shared pool for rendering thumbnail and banner concurrently; PIL's C
+# extensions release the GIL during fills and PNG encode, so threads
+# overlap the native work without process-pool pickling costs
+_render_pool = ThreadPoolExecutor(max_workers=2)
+
+# Paths of already-rendered images keyed by their text inputs, so task
+# retries and repeated topics skip the render + encode entirely
+_path_cache = LFUCache(maxsize=128)
+
 class ImageGenerator:
     """Generates thumbnails and banner images for blog posts"""
     
@@ -25,27 +43,54 @@ class ImageGenerator:
             'dark': '#1A1A2E',     # Dark blue
             'light': '#FFFFFF'     # White
         }
-        
+
+        # Parse the brand palette to RGB once instead of per pixel fill
+        self.brand_rgb = {k: self._hex_to_rgb(v) for k, v in self.brand_colors.items()}
+
+        # Font handles are cached per size; repeated truetype loads
+        # otherwise dominate text rendering
+        self._fonts = {}
+
+    def _font(self, size: int) -> ImageFont.ImageFont:
+        """Get a cached font handle for the given size"""
+        font = self._fonts.get(size)
+        if font is None:
+            try:
+                font = ImageFont.truetype("Arial.ttf", size)
+            except OSError:
+                font = ImageFont.load_default()
+            self._fonts[size] = font
+        return font
+
     def generate_thumbnail(
         self,
         title: str,
         subtitle: Optional[str] = None,
-        style: str = "modern"
+        style: str = "modern",
+        return_bytes: bool = False
     ) -> str:
         """
         Generate a thumbnail image for a blog post
-        
+
         Args:
             title: Blog post title
             subtitle: Optional subtitle
             style: Visual style (modern, minimal, gradient)
-            
+            return_bytes: Return the encoded PNG instead of writing it
+                to disk (for callers that upload immediately)
+
         Returns:
-            Path to the generated thumbnail
+            Path to the generated thumbnail, or PNG bytes
         """
+        cache_key = ('thumbnail', title, subtitle, style)
+        if not return_bytes:
+            cached = _path_cache.get(cache_key)
+            if cached and os.path.exists(cached):
+                return cached
+
         # Image dimensions for thumbnail
         width, height = 1200, 630  # Standard social media size
-        
+
         # Create base image
         img = self._create_base_image(width, height, style)
         draw = ImageDraw.Draw(img)
@@ -56,34 +101,42 @@ class ImageGenerator:
         # Add Re-Defined logo/branding
         self._add_branding(img, draw)
         
-        # Save image
-        filename = f"thumbnail_{self._generate_filename(title)}.png"
-        filepath = self.static_path / filename
-        img.save(filepath, 'PNG', quality=95)
-        
-        logger.info(f"Generated thumbnail: {filepath}")
-        return str(filepath)
+        # Save image (quality= is ignored for PNG; a light zlib
+        # level keeps encode fast for a modest size increase)
+        result = self._save(img, f"thumbnail_{self._generate_filename(title)}.png", return_bytes)
+        if not return_bytes:
+            _path_cache[cache_key] = result
+        return result
     
     def generate_banner(
         self,
         title: str,
         category: Optional[str] = None,
-        style: str = "modern"
+        style: str = "modern",
+        return_bytes: bool = False
     ) -> str:
         """
         Generate a banner image for a blog post
-        
+
         Args:
             title: Blog post title
             category: Blog category
             style: Visual style
-            
+            return_bytes: Return the encoded PNG instead of writing it
+                to disk
+
         Returns:
-            Path to the generated banner
+            Path to the generated banner, or PNG bytes
         """
+        cache_key = ('banner', title, category, style)
+        if not return_bytes:
+            cached = _path_cache.get(cache_key)
+            if cached and os.path.exists(cached):
+                return cached
+
         # Banner dimensions
         width, height = 1920, 600
-        
+
         # Create base image
         img = self._create_base_image(width, height, style)
         draw = ImageDraw.Draw(img)
@@ -95,13 +148,49 @@ class ImageGenerator:
         self._add_design_elements(img, draw, style)
         
         # Save image
-        filename = f"banner_{self._generate_filename(title)}.png"
+        result = self._save(img, f"banner_{self._generate_filename(title)}.png", return_bytes)
+        if not return_bytes:
+            _path_cache[cache_key] = result
+        return result
+
+    def _save(self, img: Image.Image, filename: str, return_bytes: bool):
+        """Encode an image to disk, or in memory when the caller will
+        upload the bytes immediately (skips a disk write + readback)"""
+        if return_bytes:
+            buf = BytesIO()
+            img.save(buf, 'PNG', compress_level=1, optimize=False)
+            return buf.getvalue()
+
         filepath = self.static_path / filename
-        img.save(filepath, 'PNG', quality=95)
-        
-        logger.info(f"Generated banner: {filepath}")
+        img.save(filepath, 'PNG', compress_level=1, optimize=False)
+
+        logger.info(f"Generated image: {filepath}")
         return str(filepath)
     
+    def generate_all(
+        self,
+        title: str,
+        subtitle: Optional[str] = None,
+        category: Optional[str] = None,
+        style: str = "modern"
+    ) -> Tuple[str, str]:
+        """
+        Generate the thumbnail and banner for a post concurrently
+
+        Args:
+            title: Blog post title
+            subtitle: Optional thumbnail subtitle
+            category: Optional banner category
+            style: Visual style
+
+        Returns:
+            Tuple of (thumbnail path, banner path)
+        """
+        thumbnail = _render_pool.submit(self.generate_thumbnail, title, subtitle, style)
+        banner = _render_pool.submit(self.generate_banner, title, category, style)
+
+        return thumbnail.result(), banner.result()
+
     def generate_with_ai(
         self,
         prompt: str,
@@ -130,48 +219,44 @@ class ImageGenerator:
         if style == "gradient":
             return self._create_gradient_background(width, height)
         elif style == "minimal":
-            return Image.new('RGB', (width, height), self.brand_colors['light'])
+            return Image.new('RGB', (width, height), self.brand_rgb['light'])
         else:  # modern
             return self._create_modern_background(width, height)
     
     def _create_gradient_background(self, width: int, height: int) -> Image.Image:
         """Create gradient background"""
-        img = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(img)
-        
-        # Create gradient from primary to secondary color
-        for i in range(height):
-            ratio = i / height
-            r = int(self._hex_to_rgb(self.brand_colors['primary'])[0] * (1 - ratio) + 
-                   self._hex_to_rgb(self.brand_colors['secondary'])[0] * ratio)
-            g = int(self._hex_to_rgb(self.brand_colors['primary'])[1] * (1 - ratio) + 
-                   self._hex_to_rgb(self.brand_colors['secondary'])[1] * ratio)
-            b = int(self._hex_to_rgb(self.brand_colors['primary'])[2] * (1 - ratio) + 
-                   self._hex_to_rgb(self.brand_colors['secondary'])[2] * ratio)
-            
-            draw.line([(0, i), (width, i)], fill=(r, g, b))
-        
-        return img
+        # Interpolate primary -> secondary in one vectorized pass
+        # instead of drawing a line per scanline
+        c0 = np.array(self.brand_rgb['primary'], np.float32)
+        c1 = np.array(self.brand_rgb['secondary'], np.float32)
+
+        ratio = np.linspace(0, 1, height, dtype=np.float32)[:, None, None]
+        rows = (c0 * (1 - ratio) + c1 * ratio).astype(np.uint8)
+
+        return Image.fromarray(np.broadcast_to(rows, (height, width, 3)).copy(), 'RGB')
     
     def _create_modern_background(self, width: int, height: int) -> Image.Image:
         """Create modern geometric background"""
-        img = Image.new('RGB', (width, height), self.brand_colors['dark'])
-        draw = ImageDraw.Draw(img)
-        
-        # Add geometric shapes
-        # Triangle in corner
-        draw.polygon(
-            [(0, 0), (width // 3, 0), (0, height // 3)],
-            fill=self.brand_colors['primary']
-        )
-        
-        # Circle accent
-        draw.ellipse(
-            [width - 200, height - 200, width + 100, height + 100],
-            fill=self.brand_colors['accent']
-        )
-        
-        return img
+        # Stamp the shapes with vectorized masks instead of per-shape
+        # ImageDraw rasterizer calls
+        arr = np.empty((height, width, 3), np.uint8)
+        arr[:] = self.brand_rgb['dark']
+
+        xs = np.arange(width, dtype=np.float32)[None, :]
+        ys = np.arange(height, dtype=np.float32)[:, None]
+
+        # Triangle in corner: the half-plane under the hypotenuse from
+        # (width/3, 0) to (0, height/3)
+        triangle = xs / (width // 3) + ys / (height // 3) < 1
+        arr[triangle] = self.brand_rgb['primary']
+
+        # Circle accent centered off the bottom-right corner, matching
+        # the old ellipse bounding box [w-200, h-200, w+100, h+100]
+        cx, cy, r = width - 50, height - 50, 150
+        circle = (xs - cx) ** 2 + (ys - cy) ** 2 <= r ** 2
+        arr[circle] = self.brand_rgb['accent']
+
+        return Image.fromarray(arr, 'RGB')
     
     def _add_text_to_image(
         self,
@@ -182,43 +267,40 @@ class ImageGenerator:
         height: int
     ):
         """Add text to image"""
-        # Try to load custom font, fall back to default
-        try:
-            title_font = ImageFont.truetype("Arial.ttf", 60)
-            subtitle_font = ImageFont.truetype("Arial.ttf", 30)
-        except:
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
-        
+        title_font = self._font(60)
+        subtitle_font = self._font(30)
+
         # Calculate text position
         margin = 80
         y_position = height // 3
         
-        # Draw title (word wrap if needed)
+        # Line height from the font metrics, so lines aren't shaped a
+        # second time just to advance the cursor
+        ascent, descent = title_font.getmetrics()
+        line_height = ascent + descent + 20
+
+        # Draw title (word wrap if needed); the 'mt' anchor centers
+        # inside the C extension, so no width query per line
         title_lines = self._wrap_text(title, title_font, width - 2 * margin)
         for line in title_lines:
-            bbox = draw.textbbox((0, 0), line, font=title_font)
-            text_width = bbox[2] - bbox[0]
-            x_position = (width - text_width) // 2
             draw.text(
-                (x_position, y_position),
+                (width // 2, y_position),
                 line,
                 font=title_font,
-                fill=self.brand_colors['light']
+                fill=self.brand_rgb['light'],
+                anchor='mt'
             )
-            y_position += bbox[3] - bbox[1] + 20
-        
+            y_position += line_height
+
         # Draw subtitle if provided
         if subtitle:
             y_position += 20
-            bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-            text_width = bbox[2] - bbox[0]
-            x_position = (width - text_width) // 2
             draw.text(
-                (x_position, y_position),
+                (width // 2, y_position),
                 subtitle,
                 font=subtitle_font,
-                fill=self.brand_colors['light']
+                fill=self.brand_rgb['light'],
+                anchor='mt'
             )
     
     def _add_banner_text(
@@ -230,13 +312,9 @@ class ImageGenerator:
         height: int
     ):
         """Add text specifically for banner layout"""
-        try:
-            title_font = ImageFont.truetype("Arial.ttf", 80)
-            category_font = ImageFont.truetype("Arial.ttf", 30)
-        except:
-            title_font = ImageFont.load_default()
-            category_font = ImageFont.load_default()
-        
+        title_font = self._font(80)
+        category_font = self._font(30)
+
         # Left-aligned text for banner
         margin = 100
         y_position = height // 2 - 50
@@ -247,42 +325,38 @@ class ImageGenerator:
                 (margin, y_position - 50),
                 category.upper(),
                 font=category_font,
-                fill=self.brand_colors['accent']
+                fill=self.brand_rgb['accent']
             )
         
         # Draw title
+        ascent, descent = title_font.getmetrics()
+        line_height = ascent + descent + 20
+
         title_lines = self._wrap_text(title, title_font, width - 2 * margin)
         for line in title_lines[:2]:  # Max 2 lines for banner
             draw.text(
                 (margin, y_position),
                 line,
                 font=title_font,
-                fill=self.brand_colors['light']
+                fill=self.brand_rgb['light']
             )
-            bbox = draw.textbbox((0, 0), line, font=title_font)
-            y_position += bbox[3] - bbox[1] + 20
+            y_position += line_height
     
     def _add_branding(self, img: Image.Image, draw: ImageDraw.Draw):
         """Add Re-Defined branding elements"""
         # Add logo text (in production, would load actual logo image)
-        try:
-            logo_font = ImageFont.truetype("Arial.ttf", 20)
-        except:
-            logo_font = ImageFont.load_default()
-        
+        logo_font = self._font(20)
+
         logo_text = "RE-DEFINED"
-        bbox = draw.textbbox((0, 0), logo_text, font=logo_font)
-        
-        # Position in bottom right
+
+        # Bottom right via the 'rb' anchor, skipping the bbox query
         margin = 40
-        x_position = img.width - (bbox[2] - bbox[0]) - margin
-        y_position = img.height - (bbox[3] - bbox[1]) - margin
-        
         draw.text(
-            (x_position, y_position),
+            (img.width - margin, img.height - margin),
             logo_text,
             font=logo_font,
-            fill=self.brand_colors['light']
+            fill=self.brand_rgb['light'],
+            anchor='rb'
         )
     
     def _add_design_elements(self, img: Image.Image, draw: ImageDraw.Draw, style: str):
@@ -291,49 +365,55 @@ class ImageGenerator:
             # Add accent lines
             draw.rectangle(
                 [50, img.height - 100, 200, img.height - 95],
-                fill=self.brand_colors['accent']
+                fill=self.brand_rgb['accent']
             )
             draw.rectangle(
                 [50, img.height - 85, 150, img.height - 80],
-                fill=self.brand_colors['primary']
+                fill=self.brand_rgb['primary']
             )
     
     def _wrap_text(self, text: str, font: ImageFont, max_width: int) -> list:
         """Wrap text to fit within max width"""
+        # Measure each word once and accumulate widths, instead of
+        # re-shaping the whole cumulative line for every word
         words = text.split()
+        space_width = font.getlength(' ')
         lines = []
         current_line = []
-        
+        current_width = 0.0
+
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            if bbox[2] - bbox[0] <= max_width:
+            word_width = font.getlength(word)
+            test_width = current_width + space_width + word_width if current_line else word_width
+
+            if test_width <= max_width:
                 current_line.append(word)
+                current_width = test_width
+            elif current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
-        
+                lines.append(word)
+
         if current_line:
             lines.append(' '.join(current_line))
-        
+
         return lines
     
     def _generate_filename(self, title: str) -> str:
         """Generate safe filename from title"""
         # Remove special characters and spaces
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))
-        safe_title = safe_title.replace(' ', '_').lower()
+        safe_title = _FILENAME_SANITIZE_RE.sub('', title.lower()).replace(' ', '_')
         
         # Add timestamp for uniqueness
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         return f"{safe_title[:50]}_{timestamp}"
     
-    def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple"""
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
@@ -1,15 +1,28 @@
 """
 Publisher module for posting blogs to Re-Defined website
 """
+import orjson
+import re
+import uuid
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Optional
 from loguru import logger
+from sqlalchemy.orm import selectinload
 from src.database.models import BlogPost
 from src.database.init_db import get_session
 from config.settings import settings
 
+# Strips tag-unsafe characters in one compiled-regex pass
+_TAG_SANITIZE_RE = re.compile(r'[^a-z0-9-]+')
+
+# Output directory for simulated publishes, created once at import
+_PUBLISHED_DIR = Path("published_blogs")
+_PUBLISHED_DIR.mkdir(exist_ok=True)
+
 class BlogPublisher:
     """Handles publishing blogs to the Re-Defined website"""
     
@@ -20,7 +33,23 @@ class BlogPublisher:
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
-    
+
+        # Pooled session: keep-alive skips the TCP/TLS handshake on
+        # repeat calls, and transient gateway errors are retried
+        self.http = requests.Session()
+        self.http.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+
     def publish_blog(self, blog_post_id: str) -> Dict:
         """
         Publish a blog post to the website
@@ -31,12 +60,21 @@ class BlogPublisher:
         Returns:
             Dictionary with publish status and details
         """
+        # One session covers the load, the prepare step, and the status
+        # update; the result is committed exactly once. The session is
+        # the thread-shared scoped session, so its lifecycle belongs to
+        # the caller — closing it here would detach the caller's objects
         session = get_session()
-        blog_post = session.query(BlogPost).filter_by(id=blog_post_id).first()
-        
+
+        # Sources are eagerly loaded; _prepare_blog_data iterates
+        # them, which would otherwise lazy-load one row at a time
+        blog_post = session.query(BlogPost).options(
+            selectinload(BlogPost.sources)
+        ).filter_by(id=blog_post_id).first()
+
         if not blog_post:
             raise ValueError(f"Blog post not found: {blog_post_id}")
-        
+
         if blog_post.status == "published":
             logger.warning(f"Blog post already published: {blog_post.title}")
             return {
@@ -44,48 +82,45 @@ class BlogPublisher:
                 'message': 'Blog post already published',
                 'post_id': blog_post.website_post_id
             }
-        
+
         try:
             # Prepare blog data for API
-            blog_data = self._prepare_blog_data(blog_post)
-            
+            blog_data = self._prepare_blog_data(session, blog_post)
+
             # Send to website API
             if self.api_endpoint:
                 response = self._send_to_api(blog_data)
             else:
                 # Simulate publishing for testing
                 response = self._simulate_publish(blog_data)
-            
+
             # Update blog post status
             if response['success']:
                 blog_post.status = "published"
                 blog_post.published_date = datetime.utcnow()
                 blog_post.website_post_id = response.get('post_id')
-                session.commit()
-                
                 logger.info(f"Successfully published: {blog_post.title}")
             else:
                 blog_post.status = "failed"
-                session.commit()
                 logger.error(f"Failed to publish: {response.get('message')}")
-            
+
+            session.commit()
             return response
-            
+
         except Exception as e:
             logger.error(f"Error publishing blog post: {e}")
             blog_post.status = "failed"
             session.commit()
-            
+
             return {
                 'success': False,
                 'message': str(e)
             }
-    
-    def _prepare_blog_data(self, blog_post: BlogPost) -> Dict:
+
+    def _prepare_blog_data(self, session, blog_post: BlogPost) -> Dict:
         """Prepare blog data for the website API"""
-        
-        # Load related data
-        session = get_session()
+
+        # Related data comes through the caller's session
         sources = [
             {
                 'title': source.title,
@@ -130,10 +165,11 @@ class BlogPublisher:
         """Send blog data to the website API"""
         
         try:
-            response = requests.post(
+            # Serialize with orjson instead of requests's internal
+            # json.dumps; Content-Type is already set on the session
+            response = self.http.post(
                 self.api_endpoint,
-                json=blog_data,
-                headers=self.headers,
+                data=orjson.dumps(blog_data),
                 timeout=30
             )
             
@@ -166,18 +202,12 @@ class BlogPublisher:
         logger.info(f"Blog slug: {blog_data['slug']}")
         
         # Save to local file for testing
-        from pathlib import Path
-        output_dir = Path("published_blogs")
-        output_dir.mkdir(exist_ok=True)
-        
         filename = f"{blog_data['slug']}.json"
-        filepath = output_dir / filename
-        
-        with open(filepath, 'w') as f:
-            json.dump(blog_data, f, indent=2)
-        
+        filepath = _PUBLISHED_DIR / filename
+
+        filepath.write_bytes(orjson.dumps(blog_data, option=orjson.OPT_INDENT_2))
+
         # Generate a mock post ID
-        import uuid
         mock_post_id = str(uuid.uuid4())[:8]
         
         return {
@@ -192,17 +222,16 @@ class BlogPublisher:
         
         if not sources:
             return content
-        
-        # Add citations section at the end
-        citations_section = "\n\n## Sources\n\n"
-        
-        for i, source in enumerate(sources, 1):
-            citation = f"{i}. [{source['title']}]({source['url']})"
-            if source.get('citation'):
-                citation += f" - \"{source['citation']}\""
-            citations_section += citation + "\n"
-        
-        return content + citations_section
+
+        # Add citations section at the end, built with one join instead
+        # of quadratic += concatenation
+        citations = [
+            f"{i}. [{source['title']}]({source['url']})"
+            + (f" - \"{source['citation']}\"" if source.get('citation') else "")
+            for i, source in enumerate(sources, 1)
+        ]
+
+        return content + "\n\n## Sources\n\n" + "\n".join(citations) + "\n"
     
     def _extract_tags(self, keywords: list) -> list:
         """Extract tags from keywords"""
@@ -211,17 +240,17 @@ class BlogPublisher:
         tags = []
         
         for keyword in keywords:
-            # Clean up keyword for tag
-            tag = keyword.lower().strip()
-            # Replace spaces with hyphens
-            tag = tag.replace(' ', '-')
-            # Remove special characters
-            tag = ''.join(c for c in tag if c.isalnum() or c == '-')
-            
+            if len(tags) >= 10:  # Limit to 10 tags
+                break
+
+            # Clean up keyword for tag: hyphenate spaces, then drop
+            # special characters in one regex pass
+            tag = _TAG_SANITIZE_RE.sub('', keyword.lower().strip().replace(' ', '-'))
+
             if tag and len(tag) > 2:
                 tags.append(tag)
-        
-        return tags[:10]  # Limit to 10 tags
+
+        return tags
     
     def unpublish_blog(self, blog_post_id: str) -> Dict:
         """Unpublish a blog post from the website"""
@@ -241,9 +270,8 @@ class BlogPublisher:
         try:
             if self.api_endpoint and blog_post.website_post_id:
                 # Send delete request to API
-                response = requests.delete(
+                response = self.http.delete(
                     f"{self.api_endpoint}/{blog_post.website_post_id}",
-                    headers=self.headers,
                     timeout=30
                 )
                 
@@ -283,8 +311,10 @@ class BlogPublisher:
         """Update an already published blog post"""
         
         session = get_session()
-        blog_post = session.query(BlogPost).filter_by(id=blog_post_id).first()
-        
+        blog_post = session.query(BlogPost).options(
+            selectinload(BlogPost.sources)
+        ).filter_by(id=blog_post_id).first()
+
         if not blog_post or not blog_post.website_post_id:
             return {
                 'success': False,
@@ -293,14 +323,13 @@ class BlogPublisher:
         
         try:
             # Prepare updated data
-            blog_data = self._prepare_blog_data(blog_post)
+            blog_data = self._prepare_blog_data(session, blog_post)
             
             if self.api_endpoint:
                 # Send update request to API
-                response = requests.put(
+                response = self.http.put(
                     f"{self.api_endpoint}/{blog_post.website_post_id}",
-                    json=blog_data,
-                    headers=self.headers,
+                    data=orjson.dumps(blog_data),
                     timeout=30
                 )
                 
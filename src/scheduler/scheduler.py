@@ -1,13 +1,16 @@
 """
 Scheduler for automated blog generation and publishing
 """
+import operator
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
+from sqlalchemy import update
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from loguru import logger
 from src.database.models import ScheduledTask, BlogPost
-from src.database.init_db import get_session
+from src.database.init_db import engine, get_session, session_scope
 from src.content_generator.generator import BlogGenerator
 from src.scraper.trend_scraper import TrendScraper
 from src.image_generator.generator import ImageGenerator
@@ -15,18 +18,29 @@ from src.seo_optimizer.optimizer import SEOOptimizer
 from src.publisher.publisher import BlogPublisher
 from config.settings import settings
 
+_TOPIC_TEMPLATE = "Understanding {}: A Guide for International Students".format
+
 class BlogScheduler:
     """Manages automated blog generation and publishing"""
     
     def __init__(self):
-        # Configure job store
+        # Configure job store on the shared pooled engine; passing the
+        # URL would build a second engine with default pool settings
         jobstores = {
-            'default': SQLAlchemyJobStore(url=settings.database_url)
+            'default': SQLAlchemyJobStore(engine=engine)
         }
         
-        # Create scheduler
+        # Create scheduler. max_instances=1 keeps the minutes-long
+        # generation job from overlapping itself when triggers pile up;
+        # coalesce collapses a backlog of missed runs into one
         self.scheduler = BackgroundScheduler(
             jobstores=jobstores,
+            executors={'default': ThreadPoolExecutor(4)},
+            job_defaults={
+                'coalesce': True,
+                'max_instances': 1,
+                'misfire_grace_time': 600
+            },
             timezone='UTC'
         )
         
@@ -36,7 +50,11 @@ class BlogScheduler:
         self.image_generator = ImageGenerator()
         self.seo_optimizer = SEOOptimizer()
         self.publisher = BlogPublisher()
-        
+
+        # Consecutive scrapes that found nothing; used to back off the
+        # daily scraping job on quiet installations
+        self._empty_scrapes = 0
+
     def start(self):
         """Start the scheduler"""
         self.scheduler.start()
@@ -60,7 +78,9 @@ class BlogScheduler:
             trigger="cron",
             hour=9,  # 9 AM UTC
             id="daily_trend_scraping",
-            replace_existing=True
+            replace_existing=True,
+            misfire_grace_time=3600,
+            max_instances=1
         )
         
         # Schedule blog generation (every 14 days)
@@ -69,7 +89,8 @@ class BlogScheduler:
             trigger="interval",
             days=settings.publish_interval_days,
             id="biweekly_blog_generation",
-            replace_existing=True
+            replace_existing=True,
+            max_instances=1
         )
         
         logger.info("Regular tasks scheduled")
@@ -84,15 +105,19 @@ class BlogScheduler:
         try:
             # Scrape trends
             trends = self.scraper.scrape_all_sources()
-            
+            total = sum(map(len, trends.values()))
+
             # Update task status
             self._complete_task(task, {
-                'trends_found': sum(len(t) for t in trends.values()),
+                'trends_found': total,
                 'sources': list(trends.keys())
             })
-            
-            logger.info(f"Trend scraping completed: {sum(len(t) for t in trends.values())} trends found")
-            
+
+            self._adjust_scrape_schedule(total)
+
+            # Brace style defers formatting until the sink is reached
+            logger.info("Trend scraping completed: {} trends found", total)
+
             return {'success': True, 'trends': trends}
             
         except Exception as e:
@@ -100,6 +125,28 @@ class BlogScheduler:
             self._fail_task(task, str(e))
             return {'success': False, 'error': str(e)}
     
+    def _adjust_scrape_schedule(self, trends_found: int):
+        """Back off daily scraping after repeated empty runs
+
+        After three scrapes in a row that found nothing, the job slows
+        to every 48 hours to spare API quota; the first productive run
+        restores the daily 9 AM schedule.
+        """
+        if trends_found == 0:
+            self._empty_scrapes += 1
+            if self._empty_scrapes == 3:
+                self.scheduler.reschedule_job(
+                    "daily_trend_scraping", trigger="interval", hours=48
+                )
+                logger.info("No trends found recently, slowing scraping to every 48h")
+        else:
+            if self._empty_scrapes >= 3:
+                self.scheduler.reschedule_job(
+                    "daily_trend_scraping", trigger="cron", hour=9
+                )
+                logger.info("Trends found again, restoring daily scraping")
+            self._empty_scrapes = 0
+
     def generate_and_publish_blog_task(self) -> Dict:
         """Task to generate and publish a blog post"""
         
@@ -108,9 +155,10 @@ class BlogScheduler:
         })
         
         try:
-            # Get trending topics
-            top_trends = self.scraper.get_top_trends(5)
-            
+            # Claim trending topics (selected and marked used in one
+            # transaction, so concurrent workers can't double-claim)
+            top_trends = self.scraper.get_and_mark_top_trends(5)
+
             if not top_trends:
                 logger.warning("No trending topics available")
                 # Generate without trends
@@ -118,10 +166,6 @@ class BlogScheduler:
             else:
                 # Select best topic
                 topic = self._select_best_topic(top_trends)
-                
-                # Mark trends as used
-                trend_ids = [t.id for t in top_trends[:3]]
-                self.scraper.mark_trends_used(trend_ids)
             
             # Search for sources
             sources = self.scraper.search_sources_for_topic(topic)
@@ -150,12 +194,12 @@ class BlogScheduler:
                 'slug': blog_post.slug
             })
             
-            # Update blog with SEO optimizations
+            # Update blog with SEO optimizations (committed together
+            # with the image paths below: one transaction per publish)
             session = get_session()
             blog_post.meta_description = seo_optimizations['meta_description']
             blog_post.keywords = seo_optimizations['keywords']
-            session.commit()
-            
+
             # Generate images
             thumbnail_path = self.image_generator.generate_thumbnail(
                 blog_post.title,
@@ -165,7 +209,7 @@ class BlogScheduler:
                 blog_post.title,
                 category="Career Development"
             )
-            
+
             # Update blog with images
             blog_post.thumbnail_url = thumbnail_path
             blog_post.banner_image_url = banner_path
@@ -257,12 +301,12 @@ class BlogScheduler:
             thumbnail_path = self.image_generator.generate_thumbnail(blog_post.title)
             banner_path = self.image_generator.generate_banner(blog_post.title)
             
-            # Update blog
+            # Update blog with images and review scheduling in one
+            # transaction
             session = get_session()
             blog_post.thumbnail_url = thumbnail_path
             blog_post.banner_image_url = banner_path
-            session.commit()
-            
+
             # Schedule for review (don't auto-publish custom blogs)
             blog_post.status = "scheduled"
             blog_post.scheduled_date = datetime.utcnow() + timedelta(hours=24)
@@ -283,56 +327,69 @@ class BlogScheduler:
     def _select_best_topic(self, trends: List) -> str:
         """Select the best topic from trending topics"""
         
-        # Sort by relevance score
-        sorted_trends = sorted(trends, key=lambda x: x.relevance_score, reverse=True)
-        
-        # Get the most relevant trend
-        best_trend = sorted_trends[0]
-        
-        # Convert to a blog topic
+        # Only the most relevant trend is needed; max is a single O(N)
+        # pass with no intermediate sorted list
+        best_trend = max(trends, key=operator.attrgetter('relevance_score'))
+
+        # Questions are already usable topics; anything else goes
+        # through the module-level template
         if "?" in best_trend.topic:
-            # It's already a question
             return best_trend.topic
-        else:
-            # Convert to a topic
-            return f"Understanding {best_trend.topic}: A Guide for International Students"
+        return _TOPIC_TEMPLATE(best_trend.topic)
     
     def _create_task(self, task_type: str, parameters: Dict) -> ScheduledTask:
         """Create a scheduled task record"""
-        
-        session = get_session()
-        
-        task = ScheduledTask(
-            task_type=task_type,
-            status="running",
-            scheduled_for=datetime.utcnow(),
-            started_at=datetime.utcnow(),
-            parameters=parameters
-        )
-        
-        session.add(task)
-        session.commit()
-        
+
+        with session_scope() as session:
+            task = ScheduledTask(
+                task_type=task_type,
+                status="running",
+                scheduled_for=datetime.utcnow(),
+                started_at=datetime.utcnow(),
+                parameters=parameters
+            )
+
+            session.add(task)
+            session.flush()
+
+            # Detach so the record outlives this session; status updates
+            # merge it back into a fresh scope
+            session.expunge(task)
+
         return task
-    
+
+    def _update_task(self, task: ScheduledTask, **fields):
+        """Write a task status change as one UPDATE statement"""
+        for name, value in fields.items():
+            setattr(task, name, value)
+
+        with session_scope() as session:
+            session.execute(
+                update(ScheduledTask)
+                .where(ScheduledTask.id == task.id)
+                .values(**fields)
+            )
+
     def _complete_task(self, task: ScheduledTask, result: Dict):
         """Mark task as completed"""
-        
-        session = get_session()
-        task.status = "completed"
-        task.completed_at = datetime.utcnow()
-        task.result = result
-        session.commit()
-    
+
+        self._update_task(
+            task,
+            status="completed",
+            completed_at=datetime.utcnow(),
+            result=result
+        )
+
     def _fail_task(self, task: ScheduledTask, error_message: str):
         """Mark task as failed"""
-        
-        session = get_session()
-        task.status = "failed"
-        task.completed_at = datetime.utcnow()
-        task.error_message = error_message
-        task.retry_count += 1
-        session.commit()
+
+        self._update_task(
+            task,
+            status="failed",
+            completed_at=datetime.utcnow(),
+            error_message=error_message,
+            retry_count=task.retry_count + 1
+        )
     
     def get_scheduled_tasks(self, status: Optional[str] = None) -> List[ScheduledTask]:
         """Get scheduled tasks"""
@@ -2,34 +2,67 @@
 Text utility functions for blog processing
 """
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import List
 import unicodedata
 
+# Translation table stripping markdown punctuation in one C pass
+_MARKDOWN_CHARS = str.maketrans('', '', '#*_[]()')
+
+# Patterns compiled once at import so hot paths skip re's cache probe
+# and argument parsing on every call
+_SLUG_NONALNUM = re.compile(r'[^a-z0-9]+')
+_SLUG_DASHES = re.compile(r'-+')
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+# Maps every Latin-1 codepoint outside [a-z0-9 ] to a space so keyword
+# tokenization is one C-level translate + split instead of per-word regexes
+_KEYWORD_TRANS = {
+    cp: ' '
+    for cp in range(256)
+    if not ('a' <= chr(cp) <= 'z' or '0' <= chr(cp) <= '9' or chr(cp) == ' ')
+}
+
+_STOP_WORDS = frozenset({
+    'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but',
+    'in', 'with', 'to', 'for', 'of', 'as', 'by', 'that', 'this',
+    'it', 'from', 'be', 'are', 'been', 'was', 'were', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'can'
+})
+
+@lru_cache(maxsize=1024)
 def generate_slug(title: str) -> str:
     """
     Generate a URL-friendly slug from a title
-    
+
+    Slugging is deterministic and the same titles recur (previews,
+    retries, SEO passes), so results are memoized.
+
     Args:
         title: The blog post title
-        
+
     Returns:
         URL-friendly slug
     """
     # Convert to lowercase
     slug = title.lower()
-    
-    # Remove accents
-    slug = unicodedata.normalize('NFKD', slug)
-    slug = slug.encode('ascii', 'ignore').decode('ascii')
+
+    # Remove accents; already-ASCII titles (the common case) skip the
+    # NFKD table walk and the codec round trip entirely
+    if not slug.isascii():
+        slug = unicodedata.normalize('NFKD', slug)
+        slug = slug.encode('ascii', 'ignore').decode('ascii')
     
     # Replace spaces and special characters with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
-    
+    slug = _SLUG_NONALNUM.sub('-', slug)
+
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
-    
+
     # Remove consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_DASHES.sub('-', slug)
     
     # Limit length
     if len(slug) > 100:
@@ -47,12 +80,9 @@ def count_words(text: str) -> int:
     Returns:
         Number of words
     """
-    # Remove markdown formatting
-    text = re.sub(r'[#*_\[\]()]', '', text)
-    
-    # Split by whitespace and count
-    words = text.split()
-    return len(words)
+    # Remove markdown formatting, then split by whitespace and count;
+    # translate + split keeps the whole count in C code
+    return len(text.translate(_MARKDOWN_CHARS).split())
 
 def estimate_reading_time(text: str, wpm: int = 200) -> int:
     """
@@ -82,33 +112,15 @@ def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
     Returns:
         List of keywords
     """
-    # Simple keyword extraction based on frequency
-    # Remove common words
-    stop_words = {
-        'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but',
-        'in', 'with', 'to', 'for', 'of', 'as', 'by', 'that', 'this',
-        'it', 'from', 'be', 'are', 'been', 'was', 'were', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'must', 'can', 'could'
-    }
-    
-    # Convert to lowercase and split
-    words = text.lower().split()
-    
-    # Remove punctuation and stop words
-    words = [re.sub(r'[^a-z0-9]', '', word) for word in words]
-    words = [word for word in words if word and word not in stop_words and len(word) > 3]
-    
-    # Count frequency
-    word_freq = {}
-    for word in words:
-        word_freq[word] = word_freq.get(word, 0) + 1
-    
-    # Sort by frequency and return top keywords
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    keywords = [word for word, freq in sorted_words[:max_keywords]]
-    
-    return keywords
+    # Simple keyword extraction based on frequency: lowercase, map
+    # punctuation to spaces, and split all in C, then drop short words
+    # and stop words before counting
+    words = text.lower().translate(_KEYWORD_TRANS).split()
+    candidates = (word for word in words if len(word) > 3 and word not in _STOP_WORDS)
+
+    # Counter is a single C-implemented pass instead of a Python dict
+    # loop plus full sort
+    return [word for word, freq in Counter(candidates).most_common(max_keywords)]
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     """
@@ -124,15 +136,13 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     """
     if len(text) <= max_length:
         return text
-    
-    # Truncate at word boundary
-    truncated = text[:max_length - len(suffix)]
-    last_space = truncated.rfind(' ')
-    
-    if last_space > 0:
-        truncated = truncated[:last_space]
-    
-    return truncated + suffix
+
+    # Truncate at word boundary, searching the original string with a
+    # bounded rfind so no intermediate copy is sliced off first
+    end = max_length - len(suffix)
+    last_space = text.rfind(' ', 0, end)
+
+    return text[:last_space if last_space > 0 else end] + suffix
 
 def clean_html(text: str) -> str:
     """
@@ -144,7 +154,7 @@ def clean_html(text: str) -> str:
     Returns:
         Clean text without HTML
     """
-    return re.sub(r'<[^>]+>', '', text)
+    return _HTML_TAG.sub('', text)
 
 def format_citation(source: dict, style: str = "apa") -> str:
     """
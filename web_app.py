@@ -1,55 +1,106 @@
 """
 Re-Defined Blog Website - Beautiful Local Website with Tailwind CSS
 """
+import asyncio
+import hashlib
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
-from fastapi import FastAPI, Request, HTTPException, Query
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, Request, HTTPException, Query, Response
+from jinja2 import FileSystemBytecodeCache
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine, desc
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import case, desc, func, select
 from typing import Optional
 import uvicorn
 from loguru import logger
 
 from config.settings import settings
-from src.database.models import BlogPost, Source, GenerationData, TrendingTopic
-from src.database.init_db import get_session
+from src.database.models import BlogPost, TrendingTopic
+from src.database.init_db import AsyncSessionLocal, get_async_db
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Re-Defined Blog Website",
     description="Beautiful blog website showcasing AI-generated content",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Setup templates and static files
 templates = Jinja2Templates(directory="web/templates")
 app.mount("/static", StaticFiles(directory="web/static"), name="static")
 
-# Database setup
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Persist compiled template bytecode across restarts, and stop stat-ing
+# template files on every render outside of dev
+_jinja_cache_dir = settings.cache_path / "jinja"
+_jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(_jinja_cache_dir))
+if settings.env != "dev":
+    templates.env.auto_reload = False
 
-def get_db():
-    """Get database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Rendered pages cached for 60s so repeat hits skip the DB queries and
+# Jinja render entirely; the ETag lets clients revalidate with a 304
+_page_cache = TTLCache(maxsize=512, ttl=60)
+
+# Columns the listing cards actually render; selecting these as plain
+# rows skips ORM instance bookkeeping and leaves the full content
+# column out of the result set
+_LIST_COLS = (
+    BlogPost.id,
+    BlogPost.title,
+    BlogPost.slug,
+    BlogPost.status,
+    BlogPost.summary,
+    BlogPost.meta_description,
+    BlogPost.thumbnail_url,
+    BlogPost.reading_time,
+    BlogPost.word_count,
+    BlogPost.keywords,
+    BlogPost.created_at,
+)
+
+def _respond_from_cache(request: Request, entry) -> Response:
+    """Build a response from a cached page, honoring If-None-Match"""
+    body, media_type, etag = entry
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
 
-def get_blog_stats():
+    return Response(content=body, media_type=media_type, headers=headers)
+
+def _cache_page(request: Request, key, response: Response) -> Response:
+    """Store a freshly rendered page and respond from the cached copy"""
+    body = bytes(response.body)
+    entry = (body, response.media_type, hashlib.md5(body).hexdigest())
+    _page_cache[key] = entry
+
+    return _respond_from_cache(request, entry)
+
+async def get_blog_stats(db: Optional[AsyncSession] = None):
     """Get blog statistics for the homepage"""
+    if db is None:
+        async with AsyncSessionLocal() as session:
+            return await get_blog_stats(session)
+
     try:
-        session = get_session()
-        total_blogs = session.query(BlogPost).count()
-        published_blogs = session.query(BlogPost).filter_by(status='published').count()
-        trending_topics = session.query(TrendingTopic).count()
-        
+        # One round trip: conditional counts over blog_posts plus a
+        # scalar subquery for the trending-topics total
+        result = await db.execute(
+            select(
+                func.count(BlogPost.id),
+                func.count(case((BlogPost.status == 'published', 1))),
+                select(func.count(TrendingTopic.id)).scalar_subquery()
+            )
+        )
+        total_blogs, published_blogs, trending_topics = result.one()
+
         return {
             'total_blogs': total_blogs,
             'published_blogs': published_blogs,
@@ -63,25 +114,34 @@ def get_blog_stats():
             'trending_topics': 0
         }
 
+async def _get_latest_blogs(limit: int = 6):
+    """Fetch the newest blog posts on a session of their own"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(*_LIST_COLS).order_by(desc(BlogPost.created_at)).limit(limit)
+        )
+        return result.all()
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Homepage with beautiful landing page"""
+    cached = _page_cache.get("/")
+    if cached is not None:
+        return _respond_from_cache(request, cached)
+
     try:
-        # Get statistics
-        stats = get_blog_stats()
-        
-        # Get latest blogs
-        session = get_session()
-        latest_blogs = session.query(BlogPost)\
-            .order_by(desc(BlogPost.created_at))\
-            .limit(6)\
-            .all()
-        
-        return templates.TemplateResponse("index.html", {
+        # Stats and latest posts run concurrently, each on its own
+        # session (an AsyncSession only serves one query at a time)
+        stats, latest_blogs = await asyncio.gather(
+            get_blog_stats(),
+            _get_latest_blogs()
+        )
+
+        return _cache_page(request, "/", templates.TemplateResponse("index.html", {
             "request": request,
             "stats": stats,
             "latest_blogs": latest_blogs
-        })
+        }))
     except Exception as e:
         logger.error(f"Error in home route: {e}")
         return templates.TemplateResponse("index.html", {
@@ -92,28 +152,36 @@ async def home(request: Request):
 
 @app.get("/blogs", response_class=HTMLResponse)
 async def blog_list(
-    request: Request, 
-    status: Optional[str] = Query(None, description="Filter by blog status")
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by blog status"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Blog listing page"""
+    cache_key = ("/blogs", status)
+    cached = _page_cache.get(cache_key)
+    if cached is not None:
+        return _respond_from_cache(request, cached)
+
     try:
-        session = get_session()
-        
-        # Build query
-        query = session.query(BlogPost)
+        # Build query: card columns plus a content prefix for the
+        # excerpt fallback, instead of hydrating full ORM objects
+        stmt = select(*_LIST_COLS, func.substr(BlogPost.content, 1, 300).label('content'))
         if status:
-            query = query.filter_by(status=status)
-        
+            stmt = stmt.where(BlogPost.status == status)
+
         # Get blogs
-        blogs = query.order_by(desc(BlogPost.created_at)).all()
-        total_blogs = session.query(BlogPost).count()
-        
-        return templates.TemplateResponse("blogs.html", {
+        result = await db.execute(stmt.order_by(desc(BlogPost.created_at)))
+        blogs = result.all()
+        total_blogs = len(blogs) if not status else await db.scalar(
+            select(func.count(BlogPost.id))
+        )
+
+        return _cache_page(request, cache_key, templates.TemplateResponse("blogs.html", {
             "request": request,
             "blogs": blogs,
             "total_blogs": total_blogs,
             "status": status
-        })
+        }))
     except Exception as e:
         logger.error(f"Error in blog_list route: {e}")
         return templates.TemplateResponse("blogs.html", {
@@ -124,32 +192,33 @@ async def blog_list(
         })
 
 @app.get("/blog/{slug}", response_class=HTMLResponse)
-async def blog_detail(request: Request, slug: str):
+async def blog_detail(request: Request, slug: str, db: AsyncSession = Depends(get_async_db)):
     """Individual blog post page"""
+    cached = _page_cache.get(request.url.path)
+    if cached is not None:
+        return _respond_from_cache(request, cached)
+
     try:
-        session = get_session()
-        
-        # Get blog post
-        blog = session.query(BlogPost).filter_by(slug=slug).first()
+        # Get blog post with sources and generation data eager-loaded,
+        # so the render needs one round trip instead of three
+        result = await db.execute(
+            select(BlogPost)
+            .options(
+                selectinload(BlogPost.sources),
+                selectinload(BlogPost.generation_data)
+            )
+            .where(BlogPost.slug == slug)
+        )
+        blog = result.scalars().first()
         if not blog:
             raise HTTPException(status_code=404, detail="Blog post not found")
         
-        # Get sources for this blog
-        sources = session.query(Source)\
-            .filter_by(blog_post_id=blog.id)\
-            .all()
-        
-        # Get generation data
-        generation_data = session.query(GenerationData)\
-            .filter_by(blog_post_id=blog.id)\
-            .first()
-        
-        return templates.TemplateResponse("blog_post.html", {
+        return _cache_page(request, request.url.path, templates.TemplateResponse("blog_post.html", {
             "request": request,
             "blog": blog,
-            "sources": sources,
-            "generation_data": generation_data
-        })
+            "sources": blog.sources,
+            "generation_data": blog.generation_data
+        }))
     except HTTPException:
         raise
     except Exception as e:
@@ -157,12 +226,11 @@ async def blog_detail(request: Request, slug: str):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/api/health")
-async def health_check():
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """Health check endpoint"""
     try:
         # Test database connection
-        session = get_session()
-        blog_count = session.query(BlogPost).count()
+        blog_count = await db.scalar(select(func.count(BlogPost.id)))
         
         return {
             "status": "healthy",
@@ -179,22 +247,30 @@ async def health_check():
         }
 
 @app.get("/api/stats")
-async def get_stats():
+async def get_stats(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get blog statistics API"""
+    cached = _page_cache.get("/api/stats")
+    if cached is not None:
+        return _respond_from_cache(request, cached)
+
     try:
-        stats = get_blog_stats()
-        
-        # Add more detailed stats
-        session = get_session()
-        drafts = session.query(BlogPost).filter_by(status='draft').count()
-        scheduled = session.query(BlogPost).filter_by(status='scheduled').count()
-        
+        stats = await get_blog_stats(db)
+
+        # Add more detailed stats with one conditional-count query
+        result = await db.execute(
+            select(
+                func.count(case((BlogPost.status == 'draft', 1))),
+                func.count(case((BlogPost.status == 'scheduled', 1)))
+            )
+        )
+        drafts, scheduled = result.one()
+
         stats.update({
             'drafts': drafts,
             'scheduled': scheduled
         })
-        
-        return stats
+
+        return _cache_page(request, "/api/stats", ORJSONResponse(stats))
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
         return {"error": str(e)}